@@ -0,0 +1,46 @@
+import { PrismaClient } from '@prisma/client'
+
+const prisma = new PrismaClient()
+
+// One-time backfill: sign-in looks users up by their lowercased email, so
+// accounts created before emails were lowercased on write must be lowercased
+// too. Safe to re-run; rows that are already lowercase are left alone.
+async function main() {
+  console.log('📧 Lowercasing stored user emails...')
+
+  // Skip any row whose lowercased email is already taken by another account,
+  // since the unique constraint would reject it. Those need merging by hand.
+  const updated = await prisma.$executeRaw`
+    UPDATE "User" u
+    SET "email" = lower(u."email")
+    WHERE u."email" <> lower(u."email")
+      AND NOT EXISTS (
+        SELECT 1 FROM "User" o
+        WHERE o."id" <> u."id" AND lower(o."email") = lower(u."email")
+      )
+  `
+  console.log(`✅ Lowercased ${updated} emails`)
+
+  const conflicts = await prisma.$queryRaw<{ id: string; email: string }[]>`
+    SELECT "id", "email"
+    FROM "User"
+    WHERE "email" <> lower("email")
+    ORDER BY lower("email"), "createdAt"
+  `
+  if (conflicts.length > 0) {
+    console.warn(`⚠️ ${conflicts.length} accounts share an email with another account and were not changed:`)
+    for (const user of conflicts) {
+      console.warn(`   - ${user.email} (${user.id})`)
+    }
+  }
+}
+
+main()
+  .then(async () => {
+    await prisma.$disconnect()
+  })
+  .catch(async (e) => {
+    console.error('❌ Error lowercasing emails:', e)
+    await prisma.$disconnect()
+    process.exit(1)
+  })
@@ -5,6 +5,7 @@ import { useRouter } from 'next/navigation'
 import { AdminLayout } from '@/components/admin/admin-layout'
 import { ProductImageGallery } from '@/components/admin/product-image-gallery'
 import { ReviewImport } from '@/components/admin/review-import'
+import { slugify } from '@/lib/utils'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
@@ -109,10 +110,7 @@ export default function CreateProductPage() {
     setCreatingCategory(true)
     
     try {
-      const categorySlug = newCategoryName
-        .toLowerCase()
-        .replace(/[^a-z0-9]+/g, '-')
-        .replace(/(^-|-$)+/g, '')
+      const categorySlug = slugify(newCategoryName)
 
       const response = await fetch('/api/admin/categories', {
         method: 'POST',
@@ -149,19 +147,12 @@ export default function CreateProductPage() {
     }
   }
 
-  const generateSlug = (name: string) => {
-    return name
-      .toLowerCase()
-      .replace(/[^a-z0-9]+/g, '-')
-      .replace(/(^-|-$)+/g, '')
-  }
-
   const handleInputChange = (field: string, value: any) => {
     console.log(`[CREATE_PRODUCT_PAGE] Field '${field}' changed to:`, value)
     setFormData(prev => ({
       ...prev,
       [field]: value,
-      ...(field === 'name' && { slug: generateSlug(value) })
+      ...(field === 'name' && { slug: slugify(value) })
     }))
   }
 
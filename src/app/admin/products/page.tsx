@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from 'react'
 import { AdminLayout } from '@/components/admin/admin-layout'
+import { slugify } from '@/lib/utils'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
@@ -302,13 +303,6 @@ export default function AdminProductsPage() {
     return { label: 'In Stock', color: 'bg-green-100 text-green-800' }
   }
 
-  const generateSlug = (name: string) => {
-    return name
-      .toLowerCase()
-      .replace(/[^a-z0-9]+/g, '-')
-      .replace(/^-+|-+$/g, '')
-  }
-
   return (
     <AdminLayout>
       <div className="space-y-6">
@@ -353,7 +347,7 @@ export default function AdminProductsPage() {
                         setFormData(prev => ({
                           ...prev,
                           name,
-                          slug: generateSlug(name)
+                          slug: slugify(name)
                         }))
                       }}
                       placeholder="Enter product name"
@@ -17,7 +17,11 @@ export async function GET(request: NextRequest) {
     const resource = searchParams.get('resource')
     const page = parseInt(searchParams.get('page') || '1')
     const limit = parseInt(searchParams.get('limit') || '20')
-    const sortOrder = searchParams.get('sortOrder') || 'desc'
+    const sortOrder = searchParams.get('sortOrder') === 'asc' ? 'asc' : 'desc'
+    // Id of the last log on the previous page. When given, the page starts
+    // right after it (keyset pagination), so deep pages don't scan and
+    // discard every earlier row the way an offset does
+    const cursor = searchParams.get('cursor')
 
     const skip = (page - 1) * limit
 
@@ -35,7 +39,7 @@ export async function GET(request: NextRequest) {
       where.resource = { contains: resource, mode: 'insensitive' }
     }
 
-    const [logs, totalCount] = await Promise.all([
+    const [rows, totalCount] = await Promise.all([
       prisma.activityLog.findMany({
         where,
         include: {
@@ -49,15 +53,38 @@ export async function GET(request: NextRequest) {
             }
           }
         },
-        orderBy: {
-          createdAt: sortOrder as 'asc' | 'desc'
-        },
-        skip,
-        take: limit,
+        // id breaks ties between logs written in the same millisecond, so
+        // the cursor position is unambiguous
+        orderBy: [{ createdAt: sortOrder }, { id: sortOrder }],
+        ...(cursor
+          ? { cursor: { id: cursor }, skip: 1 }
+          : { skip }),
+        // One extra row tells us whether there is a next page
+        take: limit + 1,
       }),
-      prisma.activityLog.count({ where })
+      // Cursor pages skip the total: counting every matching log on each
+      // page would cost the full scan keyset pagination avoids, and the
+      // client already has it from the first page
+      cursor ? null : prisma.activityLog.count({ where })
     ])
 
+    const hasNext = rows.length > limit
+    const logs = hasNext ? rows.slice(0, limit) : rows
+    const nextCursor = hasNext ? logs[logs.length - 1].id : null
+
+    // A cursor doesn't say which page it is on, so page-based fields are
+    // only reported for offset paging
+    if (totalCount === null) {
+      return NextResponse.json({
+        logs,
+        pagination: {
+          limit,
+          hasNext,
+          nextCursor
+        }
+      })
+    }
+
     const totalPages = Math.ceil(totalCount / limit)
 
     return NextResponse.json({
@@ -67,8 +94,9 @@ export async function GET(request: NextRequest) {
         limit,
         totalCount,
         totalPages,
-        hasNext: page < totalPages,
-        hasPrev: page > 1
+        hasNext,
+        hasPrev: page > 1,
+        nextCursor
       }
     })
   } catch (error) {
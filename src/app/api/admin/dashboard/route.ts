@@ -17,6 +17,11 @@ export async function GET(request: NextRequest) {
     const daysBack = timeRange === '7d' ? 7 : timeRange === '30d' ? 30 : 90
     const startDate = new Date(now.getTime() - (daysBack * 24 * 60 * 60 * 1000))
     const lastPeriodStart = new Date(startDate.getTime() - (daysBack * 24 * 60 * 60 * 1000))
+    // Day boundaries are UTC throughout: the "today" count, the daily
+    // revenue buckets (createdAt is stored in UTC) and the chart labels all
+    // use the same days whatever the server's timezone
+    const todayStart = new Date(now)
+    todayStart.setUTCHours(0, 0, 0, 0)
 
     // Get basic metrics
     const [
@@ -29,7 +34,7 @@ export async function GET(request: NextRequest) {
       todayOrders,
       currentPeriodRevenue,
       lastPeriodRevenue,
-      deliveredOrders
+      deliveredByDay
     ] = await Promise.all([
       prisma.user.count(),
       prisma.order.count({
@@ -44,7 +49,7 @@ export async function GET(request: NextRequest) {
       prisma.order.count({
         where: {
           createdAt: {
-            gte: new Date(new Date().setHours(0, 0, 0, 0))
+            gte: todayStart
           }
         }
       }),
@@ -65,122 +70,94 @@ export async function GET(request: NextRequest) {
         },
         _sum: { total: true }
       }),
-      prisma.order.findMany({
-        where: {
-          status: 'DELIVERED',
-          createdAt: { gte: startDate }
-        },
-        select: {
-          total: true,
-          createdAt: true
-        }
-      })
+      // Daily revenue is bucketed by UTC day in the database, so only one
+      // row per day comes back instead of every delivered order in the range
+      prisma.$queryRaw<{ day: Date; revenue: number; orders: number }[]>`
+        SELECT
+          DATE_TRUNC('day', "createdAt") as day,
+          SUM("total")::float as revenue,
+          COUNT(*)::integer as orders
+        FROM "Order"
+        WHERE "status" = 'DELIVERED' AND "createdAt" >= ${startDate}
+        GROUP BY day
+      `
     ])
 
     const currentRevenue = Number(currentPeriodRevenue._sum?.total || 0)
     const lastRevenue = Number(lastPeriodRevenue._sum?.total || 0)
     const monthlyGrowth = lastRevenue > 0 ? ((currentRevenue - lastRevenue) / lastRevenue) * 100 : 0
 
-    // Generate revenue chart data
+    // Generate revenue chart data, filling in days without deliveries
+    const revenueByDay = new Map(
+      deliveredByDay.map(row => [row.day.toISOString().slice(0, 10), row])
+    )
     const revenueChart = []
     for (let i = daysBack - 1; i >= 0; i--) {
       const date = new Date(now.getTime() - (i * 24 * 60 * 60 * 1000))
-      const dayStart = new Date(date.setHours(0, 0, 0, 0))
-      const dayEnd = new Date(date.setHours(23, 59, 59, 999))
-      
-      const dayOrders = deliveredOrders.filter(order => 
-        order.createdAt >= dayStart && order.createdAt <= dayEnd
-      )
-      
-      const dayRevenue = dayOrders.reduce((sum, order) => sum + Number(order.total), 0)
+      const day = revenueByDay.get(date.toISOString().slice(0, 10))
       
       revenueChart.push({
-        month: date.toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
-        revenue: dayRevenue,
-        orders: dayOrders.length
+        month: date.toLocaleDateString('en-US', { month: 'short', day: 'numeric', timeZone: 'UTC' }),
+        revenue: day?.revenue ?? 0,
+        orders: day?.orders ?? 0
       })
     }
 
-    // Get category performance
-    const categoryPerformance = await prisma.category.findMany({
-      select: {
-        id: true,
-        name: true,
-        products: {
-          select: {
-            orderItems: {
-              where: {
-                order: {
-                  status: 'DELIVERED',
-                  createdAt: { gte: startDate }
-                }
-              },
-              select: {
-                quantity: true,
-                price: true
-              }
-            }
-          }
-        }
-      }
-    })
+    // Get category performance, summed per category in the database
+    const categoryRevenue = await prisma.$queryRaw<{ name: string; revenue: number }[]>`
+      SELECT
+        c."name",
+        SUM(oi."price" * oi."quantity")::float as revenue
+      FROM "OrderItem" oi
+      JOIN "Order" o ON o."id" = oi."orderId"
+      JOIN "Product" p ON p."id" = oi."productId"
+      JOIN "Category" c ON c."id" = p."categoryId"
+      WHERE o."status" = 'DELIVERED' AND o."createdAt" >= ${startDate}
+      GROUP BY c."id"
+      ORDER BY revenue DESC
+      LIMIT 6
+    `
 
     const colors = ['#8884d8', '#82ca9d', '#ffc658', '#ff7300', '#8dd1e1', '#d084d0']
-    const categoryChart = categoryPerformance
-      .map((category, index) => {
-        const revenue = category.products.reduce((sum, product) => 
-          sum + product.orderItems.reduce((orderSum, item) => 
-            orderSum + (Number(item.price) * item.quantity), 0
-          ), 0
-        )
-        return {
-          name: category.name,
-          value: revenue,
-          color: colors[index % colors.length]
-        }
-      })
-      .filter(item => item.value > 0)
-      .sort((a, b) => b.value - a.value)
-      .slice(0, 6)
+    const categoryChart = categoryRevenue
+      .filter(category => category.revenue > 0)
+      .map((category, index) => ({
+        name: category.name,
+        value: category.revenue,
+        color: colors[index % colors.length]
+      }))
 
-    // Get top products
-    const topProductsRaw = await prisma.product.findMany({
-      select: {
-        id: true,
-        name: true,
-        stock: true,
-        orderItems: {
-          where: {
-            order: {
-              status: 'DELIVERED',
-              createdAt: { gte: startDate }
-            }
-          },
-          select: {
-            quantity: true,
-            price: true
-          }
-        }
-      }
-    })
+    // Get top products, summed in the database rather than loading every
+    // product with all of its order items
+    const topProductsRaw = await prisma.$queryRaw<{
+      id: string
+      name: string
+      stock: number
+      sales: number
+      revenue: number
+    }[]>`
+      SELECT
+        p."id",
+        p."name",
+        p."stock",
+        SUM(oi."quantity")::integer as sales,
+        SUM(oi."price" * oi."quantity")::float as revenue
+      FROM "OrderItem" oi
+      JOIN "Order" o ON o."id" = oi."orderId"
+      JOIN "Product" p ON p."id" = oi."productId"
+      WHERE o."status" = 'DELIVERED' AND o."createdAt" >= ${startDate}
+      GROUP BY p."id"
+      ORDER BY revenue DESC
+      LIMIT 5
+    `
 
-    const topProducts = topProductsRaw
-      .map(product => {
-        const sales = product.orderItems.reduce((sum, item) => sum + item.quantity, 0)
-        const revenue = product.orderItems.reduce((sum, item) => 
-          sum + (Number(item.price) * item.quantity), 0
-        )
-        return {
-          id: product.id,
-          name: product.name,
-          sales,
-          revenue,
-          stock: product.stock
-        }
-      })
-      .filter(product => product.sales > 0)
-      .sort((a, b) => b.revenue - a.revenue)
-      .slice(0, 5)
+    const topProducts = topProductsRaw.map(product => ({
+      id: product.id,
+      name: product.name,
+      sales: product.sales,
+      revenue: product.revenue,
+      stock: product.stock
+    }))
 
     // Get recent activity
     const [recentOrders, recentServices] = await Promise.all([
@@ -211,14 +188,14 @@ export async function GET(request: NextRequest) {
         id: order.id,
         type: 'order' as const,
         description: `New ${order.status.toLowerCase()} order received`,
-        timestamp: formatTimeAgo(order.createdAt),
+        timestamp: formatTimeAgo(order.createdAt, now),
         amount: Number(order.total)
       })),
       ...recentServices.map(service => ({
         id: service.id,
         type: 'service' as const,
         description: `${service.type.toLowerCase()} service booked`,
-        timestamp: formatTimeAgo(service.createdAt),
+        timestamp: formatTimeAgo(service.createdAt, now),
         amount: service.price ? Number(service.price) : undefined
       }))
     ]
@@ -253,8 +230,7 @@ export async function GET(request: NextRequest) {
   }
 }
 
-function formatTimeAgo(date: Date): string {
-  const now = new Date()
+function formatTimeAgo(date: Date, now: Date): string {
   const diffInSeconds = Math.floor((now.getTime() - date.getTime()) / 1000)
   
   if (diffInSeconds < 60) return 'Just now'
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
+import { primaryImage } from '@/lib/product-queries'
 import { z } from 'zod'
 
 const updateOrderStatusSchema = z.object({
@@ -31,6 +32,7 @@ export async function GET(request: NextRequest) {
     const search = searchParams.get('search') // customer name or email
     const dateFrom = searchParams.get('dateFrom')
     const dateTo = searchParams.get('dateTo')
+    const oversold = searchParams.get('oversold') === 'true'
     const sortBy = searchParams.get('sortBy') || 'createdAt'
     const sortOrder = searchParams.get('sortOrder') || 'desc'
 
@@ -43,6 +45,11 @@ export async function GET(request: NextRequest) {
       where.status = status
     }
 
+    // Orders paid for while a product was out of stock
+    if (oversold) {
+      where.stockShortfall = { gt: 0 }
+    }
+
     if (search) {
       where.OR = [
         { user: { name: { contains: search, mode: 'insensitive' } } },
@@ -71,6 +78,10 @@ export async function GET(request: NextRequest) {
         skip,
         take: limit,
         orderBy,
+        // The list and its detail panel never show the payment reference
+        omit: {
+          stripePaymentId: true
+        },
         include: {
           user: {
             select: {
@@ -79,20 +90,23 @@ export async function GET(request: NextRequest) {
               email: true
             }
           },
+          // Only the columns the detail panel renders for each line item
           items: {
-            include: {
+            select: {
+              id: true,
+              quantity: true,
+              price: true,
               product: {
                 select: {
                   id: true,
                   name: true,
                   slug: true,
                   images: {
+                    ...primaryImage,
                     select: {
                       url: true,
                       altText: true
-                    },
-                    take: 1,
-                    orderBy: { position: 'asc' }
+                    }
                   }
                 }
               }
@@ -212,8 +226,7 @@ export async function PATCH(request: NextRequest) {
     console.log('[ADMIN_ORDERS_PATCH] Validated data:', JSON.stringify(validatedData, null, 2))
 
     const updateData: any = {
-      status: validatedData.status,
-      updatedAt: new Date()
+      status: validatedData.status
     }
 
     if (validatedData.trackingNumber) {
@@ -314,8 +327,7 @@ export async function POST(request: NextRequest) {
     const updatedOrder = await prisma.order.update({
       where: { id: orderId },
       data: {
-        adminNotes: notes,
-        updatedAt: new Date()
+        adminNotes: notes
       },
       include: {
         user: {
@@ -333,12 +345,11 @@ export async function POST(request: NextRequest) {
                 name: true,
                 slug: true,
                 images: {
+                  ...primaryImage,
                   select: {
                     url: true,
                     altText: true
-                  },
-                  take: 1,
-                  orderBy: { position: 'asc' }
+                  }
                 }
               }
             }
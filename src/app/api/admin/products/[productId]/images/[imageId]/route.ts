@@ -23,27 +23,23 @@ export async function PATCH(
     const body = await request.json()
     const validatedData = updateImageSchema.parse(body)
 
-    // Verify image exists and belongs to product
-    const existingImage = await prisma.productImage.findFirst({
+    // Update the image only if it belongs to this product; no row back
+    // means it doesn't exist here, so no separate lookup is needed
+    const [updatedImage] = await prisma.productImage.updateManyAndReturn({
       where: { 
         id: imageId,
         productId: productId 
-      }
+      },
+      data: validatedData
     })
 
-    if (!existingImage) {
+    if (!updatedImage) {
       return NextResponse.json(
         { error: 'Image not found' },
         { status: 404 }
       )
     }
 
-    // Update image
-    const updatedImage = await prisma.productImage.update({
-      where: { id: imageId },
-      data: validatedData
-    })
-
     return NextResponse.json({ image: updatedImage })
   } catch (error) {
     if (error instanceof z.ZodError) {
@@ -74,41 +70,32 @@ export async function DELETE(
 
     const { productId, imageId } = await params
 
-    // Verify image exists and belongs to product
-    const existingImage = await prisma.productImage.findFirst({
+    // Delete the image only if it belongs to this product
+    const { count: deleted } = await prisma.productImage.deleteMany({
       where: { 
         id: imageId,
         productId: productId 
       }
     })
 
-    if (!existingImage) {
+    if (deleted === 0) {
       return NextResponse.json(
         { error: 'Image not found' },
         { status: 404 }
       )
     }
 
-    // Delete image
-    await prisma.productImage.delete({
-      where: { id: imageId }
-    })
-
-    // Reorder remaining images to fill gaps
-    const remainingImages = await prisma.productImage.findMany({
-      where: { productId },
-      orderBy: { position: 'asc' }
-    })
-
-    // Update positions to be sequential
-    await Promise.all(
-      remainingImages.map((img, index) =>
-        prisma.productImage.update({
-          where: { id: img.id },
-          data: { position: index }
-        })
-      )
-    )
+    // Renumber the remaining images to fill the gap in one statement,
+    // writing only the rows whose position actually changes
+    await prisma.$executeRaw`
+      UPDATE "ProductImage" pi SET "position" = ranked.position
+      FROM (
+        SELECT "id", (ROW_NUMBER() OVER (ORDER BY "position", "id") - 1)::integer as position
+        FROM "ProductImage"
+        WHERE "productId" = ${productId}
+      ) ranked
+      WHERE pi."id" = ranked."id" AND pi."position" <> ranked.position
+    `
 
     return NextResponse.json({ message: 'Image deleted successfully' })
   } catch (error) {
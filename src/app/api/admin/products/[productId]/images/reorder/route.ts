@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
+import { Prisma } from '@prisma/client'
 import { z } from 'zod'
 
 const reorderImagesSchema = z.object({
@@ -27,7 +28,8 @@ export async function PATCH(
 
     // Verify product exists
     const product = await prisma.product.findUnique({
-      where: { id: productId }
+      where: { id: productId },
+      select: { id: true }
     })
 
     if (!product) {
@@ -37,22 +39,23 @@ export async function PATCH(
       )
     }
 
-    // Update positions in a transaction to ensure consistency
-    await prisma.$transaction(
-      validatedData.imageOrders.map(({ id, position }) =>
-        prisma.productImage.updateMany({
-          where: { 
-            id,
-            productId // Ensure the image belongs to this product
-          },
-          data: { position }
-        })
+    // Update every position in one statement. The productId condition
+    // ensures only images belonging to this product are touched
+    let updatedCount = 0
+    if (validatedData.imageOrders.length > 0) {
+      const positions = Prisma.join(
+        validatedData.imageOrders.map(({ id, position }) => Prisma.sql`(${id}, ${position}::integer)`)
       )
-    )
+      updatedCount = await prisma.$executeRaw`
+        UPDATE "ProductImage" pi SET "position" = ordered.position
+        FROM (VALUES ${positions}) AS ordered(id, position)
+        WHERE pi."id" = ordered.id AND pi."productId" = ${productId}
+      `
+    }
 
     return NextResponse.json({ 
       message: 'Images reordered successfully',
-      updatedCount: validatedData.imageOrders.length
+      updatedCount
     })
   } catch (error) {
     if (error instanceof z.ZodError) {
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
+import { Prisma } from '@prisma/client'
 import { z } from 'zod'
 
 const createImagesSchema = z.object({
@@ -35,7 +36,8 @@ export async function POST(
 
     // Verify product exists
     const product = await prisma.product.findUnique({
-      where: { id: productId }
+      where: { id: productId },
+      select: { id: true }
     })
 
     if (!product) {
@@ -45,19 +47,15 @@ export async function POST(
       )
     }
 
-    // Create images
-    const createdImages = await Promise.all(
-      validatedData.images.map(imageData =>
-        prisma.productImage.create({
-          data: {
-            productId,
-            url: imageData.url,
-            altText: imageData.altText || '',
-            position: imageData.position
-          }
-        })
-      )
-    )
+    // Create images with one multi-row INSERT ... RETURNING
+    const createdImages = await prisma.productImage.createManyAndReturn({
+      data: validatedData.images.map(imageData => ({
+        productId,
+        url: imageData.url,
+        altText: imageData.altText || '',
+        position: imageData.position
+      }))
+    })
 
     return NextResponse.json({ images: createdImages }, { status: 201 })
   } catch (error) {
@@ -94,15 +92,17 @@ export async function PATCH(
     if (body.imageOrders) {
       const validatedData = reorderImagesSchema.parse(body)
 
-      // Update positions in batch
-      await Promise.all(
-        validatedData.imageOrders.map(({ id, position }) =>
-          prisma.productImage.update({
-            where: { id, productId },
-            data: { position }
-          })
+      // Update positions in one statement instead of one query per image
+      if (validatedData.imageOrders.length > 0) {
+        const positions = Prisma.join(
+          validatedData.imageOrders.map(({ id, position }) => Prisma.sql`(${id}, ${position}::integer)`)
         )
-      )
+        await prisma.$executeRaw`
+          UPDATE "ProductImage" pi SET "position" = ordered.position
+          FROM (VALUES ${positions}) AS ordered(id, position)
+          WHERE pi."id" = ordered.id AND pi."productId" = ${productId}
+        `
+      }
 
       return NextResponse.json({ message: 'Images reordered successfully' })
     }
@@ -87,37 +87,32 @@ export async function GET(
     }
 
     // Calculate sales metrics
-    const salesMetrics = await prisma.orderItem.aggregate({
-      where: {
-        productId: productId,
-        order: {
-          status: OrderStatus.DELIVERED
-        }
-      },
-      _sum: {
-        quantity: true
-      },
-      _count: {
-        id: true
-      }
-    })
-
-    const revenue = await prisma.orderItem.findMany({
-      where: {
-        productId: productId,
-        order: {
-          status: OrderStatus.DELIVERED
+    const [salesMetrics, revenue] = await Promise.all([
+      prisma.orderItem.aggregate({
+        where: {
+          productId: productId,
+          order: {
+            status: OrderStatus.DELIVERED
+          }
+        },
+        _sum: {
+          quantity: true
+        },
+        _count: {
+          id: true
         }
-      },
-      select: {
-        quantity: true,
-        price: true
-      }
-    })
+      }),
+      // Revenue is price * quantity per line, which Prisma's aggregate can't
+      // express, so it is summed in SQL rather than over every sold line here
+      prisma.$queryRaw<{ total: number }[]>`
+        SELECT COALESCE(SUM(oi."price" * oi."quantity"), 0)::float as total
+        FROM "OrderItem" oi
+        JOIN "Order" o ON o."id" = oi."orderId"
+        WHERE oi."productId" = ${productId} AND o."status" = 'DELIVERED'
+      `
+    ])
 
-    const totalRevenue = revenue.reduce((sum, item) => {
-      return sum + (Number(item.price) * item.quantity)
-    }, 0)
+    const totalRevenue = revenue[0]?.total ?? 0
 
     // Convert Decimal fields to numbers for frontend consumption
     const productWithNumbers = {
@@ -262,9 +257,10 @@ export async function DELETE(
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
-    // Check if product exists
+    // Check the product exists and count its order lines in one query
     const existingProduct = await prisma.product.findUnique({
-      where: { id: productId }
+      where: { id: productId },
+      select: { _count: { select: { orderItems: true } } }
     })
 
     if (!existingProduct) {
@@ -272,33 +268,17 @@ export async function DELETE(
     }
 
     // Check if product has orders (prevent deletion if it has order history)
-    const orderCount = await prisma.orderItem.count({
-      where: { productId: productId }
-    })
-
-    if (orderCount > 0) {
+    if (existingProduct._count.orderItems > 0) {
       return NextResponse.json(
         { error: 'Cannot delete product with existing orders. Consider marking as inactive instead.' },
         { status: 400 }
       )
     }
 
-    // Delete related data first
-    await prisma.$transaction(async (tx) => {
-      // Delete cart items
-      await tx.cartItem.deleteMany({
-        where: { productId: productId }
-      })
-
-      // Delete product images
-      await tx.productImage.deleteMany({
-        where: { productId: productId }
-      })
-
-      // Delete the product
-      await tx.product.delete({
-        where: { id: productId }
-      })
+    // Cart items, images and reviews are removed by their ON DELETE CASCADE
+    // foreign keys in the same statement
+    await prisma.product.delete({
+      where: { id: productId }
     })
 
     console.log(`[ADMIN_PRODUCT_DELETE] Successfully deleted product: ${productId}`)
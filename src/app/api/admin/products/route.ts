@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
+import { primaryImage } from '@/lib/product-queries'
 import { z } from 'zod'
 
 const createProductSchema = z.object({
@@ -97,12 +98,21 @@ export async function GET(request: NextRequest) {
     const orderBy: any = {}
     orderBy[sortBy] = sortOrder
 
-    const [products, totalCount, categories] = await Promise.all([
+    // Inventory insights don't depend on the page query, so run them in the
+    // same round of concurrent queries
+    const [products, totalCount, categories, lowStockCount, outOfStockCount] = await Promise.all([
       prisma.product.findMany({
         where,
         skip,
         take: limit,
         orderBy,
+        // SEO fields and the specifications blob are only edited on the
+        // product page, not shown in the list
+        omit: {
+          specifications: true,
+          metaTitle: true,
+          metaDescription: true
+        },
         include: {
           category: {
             select: {
@@ -111,14 +121,15 @@ export async function GET(request: NextRequest) {
               slug: true
             }
           },
+          // The list only shows a thumbnail, so load just the primary image
           images: {
+            ...primaryImage,
             select: {
               id: true,
               url: true,
               altText: true,
               position: true
-            },
-            orderBy: { position: 'asc' }
+            }
           },
           _count: {
             select: {
@@ -140,19 +151,17 @@ export async function GET(request: NextRequest) {
             }
           }
         }
+      }),
+      prisma.product.count({
+        where: { stock: { lte: 10, gt: 0 } }
+      }),
+      prisma.product.count({
+        where: { stock: { lte: 0 } }
       })
     ])
 
     const totalPages = Math.ceil(totalCount / limit)
 
-    // Calculate inventory insights
-    const lowStockCount = await prisma.product.count({
-      where: { stock: { lte: 10, gt: 0 } }
-    })
-    const outOfStockCount = await prisma.product.count({
-      where: { stock: { lte: 0 } }
-    })
-
     // Convert Decimal fields to numbers for frontend consumption
     const productsWithNumbers = products.map(product => ({
       ...product,
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
+import { Prisma } from '@prisma/client'
 import { z } from 'zod'
 
 const reviewImportSchema = z.object({
@@ -8,7 +9,7 @@ const reviewImportSchema = z.object({
     productId: z.string().optional(),
     productSku: z.string().optional(),
     productSlug: z.string().optional(),
-    userEmail: z.string().email('Invalid email format'),
+    userEmail: z.string().email('Invalid email format').toLowerCase(),
     userName: z.string().optional(),
     rating: z.number().int().min(1).max(5),
     title: z.string().optional(),
@@ -42,6 +43,7 @@ export async function POST(request: NextRequest) {
     let failed = 0
     let duplicates = 0
     const errors: string[] = []
+    const pendingReviews: Prisma.ReviewCreateManyInput[] = []
 
     // Process reviews in batches for better performance
     const batchSize = 10
@@ -62,11 +64,13 @@ export async function POST(request: NextRequest) {
             
             if (reviewData.productSku) {
               product = await prisma.product.findUnique({
-                where: { sku: reviewData.productSku }
+                where: { sku: reviewData.productSku },
+                select: { id: true }
               })
             } else if (reviewData.productSlug) {
               product = await prisma.product.findUnique({
-                where: { slug: reviewData.productSlug }
+                where: { slug: reviewData.productSlug },
+                select: { id: true }
               })
             }
             
@@ -78,7 +82,8 @@ export async function POST(request: NextRequest) {
           } else {
             // Verify productId exists
             const product = await prisma.product.findUnique({
-              where: { id: productId }
+              where: { id: productId },
+              select: { id: true }
             })
             
             if (!product) {
@@ -86,40 +91,20 @@ export async function POST(request: NextRequest) {
             }
           }
 
-          // Find or create user
-          let user = await prisma.user.findUnique({
-            where: { email: reviewData.userEmail }
+          // Find or create user (userEmail is lowercased by the schema)
+          const user = await prisma.user.upsert({
+            where: { email: reviewData.userEmail },
+            update: {},
+            create: {
+              email: reviewData.userEmail,
+              name: reviewData.userName || reviewData.userEmail.split('@')[0],
+              role: 'USER'
+            },
+            select: { id: true }
           })
 
-          if (!user) {
-            console.log(`[REVIEW_IMPORT] Creating new user: ${reviewData.userEmail}`)
-            user = await prisma.user.create({
-              data: {
-                email: reviewData.userEmail,
-                name: reviewData.userName || reviewData.userEmail.split('@')[0],
-                role: 'USER'
-              }
-            })
-          }
-
-          // Check for existing review (one review per user per product)
-          const existingReview = await prisma.review.findUnique({
-            where: {
-              productId_userId: {
-                productId: productId,
-                userId: user.id
-              }
-            }
-          })
-
-          if (existingReview) {
-            console.log(`[REVIEW_IMPORT] Duplicate review found for ${reviewData.userEmail} on product ${productId}`)
-            duplicates++
-            return
-          }
-
-          // Create the review
-          const reviewToCreate = {
+          // Queue the review; all of them are inserted together below
+          pendingReviews.push({
             productId: productId,
             userId: user.id,
             rating: reviewData.rating,
@@ -132,14 +117,7 @@ export async function POST(request: NextRequest) {
               createdAt: new Date(reviewData.createdAt),
               updatedAt: new Date(reviewData.createdAt)
             })
-          }
-
-          await prisma.review.create({
-            data: reviewToCreate
           })
-
-          console.log(`[REVIEW_IMPORT] Successfully created review ${reviewIndex + 1}`)
-          successful++
           
         } catch (error) {
           console.error(`[REVIEW_IMPORT] Error processing review ${reviewIndex + 1}:`, error)
@@ -149,6 +127,18 @@ export async function POST(request: NextRequest) {
       }))
     }
 
+    // Insert every resolved review in one statement. Rows that would break
+    // the one-review-per-user-per-product constraint are skipped by the
+    // database and reported as duplicates.
+    if (pendingReviews.length > 0) {
+      const { count } = await prisma.review.createMany({
+        data: pendingReviews,
+        skipDuplicates: true
+      })
+      successful = count
+      duplicates = pendingReviews.length - count
+    }
+
     console.log(`[REVIEW_IMPORT] Import completed: ${successful} successful, ${failed} failed, ${duplicates} duplicates`)
 
     return NextResponse.json({
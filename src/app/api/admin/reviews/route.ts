@@ -79,15 +79,22 @@ export async function GET(request: NextRequest) {
       prisma.review.count({ where })
     ])
 
-    // Calculate insights
-    const [totalReviews, averageRatingResult, hiddenReviews, verifiedReviews] = await Promise.all([
-      prisma.review.count(),
-      prisma.review.aggregate({
-        _avg: { rating: true }
-      }),
-      prisma.review.count({ where: { isVisible: false } }),
-      prisma.review.count({ where: { verified: true } })
-    ])
+    // Calculate insights in a single pass over the table rather than one
+    // count or aggregate query per figure
+    const [insightsRow] = await prisma.$queryRaw<{
+      totalReviews: number
+      averageRating: number | null
+      hiddenReviews: number
+      verifiedReviews: number
+    }[]>`
+      SELECT
+        COUNT(*)::integer as "totalReviews",
+        AVG("rating")::float as "averageRating",
+        (COUNT(*) FILTER (WHERE NOT "isVisible"))::integer as "hiddenReviews",
+        (COUNT(*) FILTER (WHERE "verified"))::integer as "verifiedReviews"
+      FROM "Review"
+    `
+    const { totalReviews, hiddenReviews, verifiedReviews } = insightsRow
 
     const totalPages = Math.ceil(totalCount / limit)
 
@@ -106,7 +113,7 @@ export async function GET(request: NextRequest) {
       },
       insights: {
         totalReviews,
-        averageRating: averageRatingResult._avg.rating || 0,
+        averageRating: insightsRow.averageRating || 0,
         hiddenReviews,
         verifiedReviews
       }
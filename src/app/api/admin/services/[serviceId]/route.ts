@@ -1,8 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
-import { ServiceStatus, Priority } from '@prisma/client'
-import { logActivity } from '@/lib/activity-logger'
+import { Prisma, ServiceStatus, Priority } from '@prisma/client'
+import { logActivityInBackground } from '@/lib/activity-logger'
+import { staffRoles, managerRoles } from '@/lib/roles'
 import { z } from 'zod'
 
 const updateServiceSchema = z.object({
@@ -16,6 +17,28 @@ const updateServiceSchema = z.object({
   completionNotes: z.string().optional()
 })
 
+// Status transitions a technician may make, built once at module load
+const technicianStatusTransitions: Partial<Record<ServiceStatus, ReadonlySet<string>>> = {
+  PENDING: new Set(['CONFIRMED', 'IN_PROGRESS']),
+  CONFIRMED: new Set(['IN_PROGRESS', 'ON_HOLD']),
+  IN_PROGRESS: new Set(['COMPLETED', 'ON_HOLD']),
+  ON_HOLD: new Set(['IN_PROGRESS', 'CONFIRMED']),
+  COMPLETED: new Set(['IN_PROGRESS']), // Allow reopening if needed
+}
+const noTransitions: ReadonlySet<string> = new Set()
+
+// Statuses in which a service may be deleted
+const deletableStatuses: ReadonlySet<ServiceStatus> = new Set<ServiceStatus>(['CANCELLED', 'PENDING'])
+
+// Fields a technician is allowed to update
+const technicianFields = new Set(['status', 'actualHours', 'partsUsed', 'notes', 'completionNotes'])
+
+// API field names that are stored under a different column name
+const columnForField: Readonly<Record<string, string>> = {
+  notes: 'issueDetails',
+  completionNotes: 'resolution',
+}
+
 export async function GET(
   request: NextRequest,
   { params }: { params: Promise<{ serviceId: string }> }
@@ -33,7 +56,7 @@ export async function GET(
       return NextResponse.json({ error: 'Unauthorized - No session' }, { status: 401 })
     }
     
-    if (!['ADMIN', 'MANAGER', 'TECHNICIAN'].includes(session.user.role)) {
+    if (!staffRoles.has(session.user.role)) {
       console.log(`🚫 SERVICE_GET: Unauthorized - user role: ${session?.user?.role}`)
       return NextResponse.json({ error: 'Unauthorized - Invalid role' }, { status: 401 })
     }
@@ -123,12 +146,17 @@ export async function PATCH(
     const body = await request.json()
     const validatedData = updateServiceSchema.parse(body)
 
-    // Get current service data for comparison
+    // Get current values for comparison, loading only the fields being
+    // updated plus the ones needed for access checks and the activity log
+    const updatedFields = Object.keys(validatedData).map((key) => columnForField[key] ?? key)
     const currentService = await prisma.service.findUnique({
       where: { id: serviceId },
-      include: {
-        user: { select: { name: true, email: true } },
-        assignedUser: { select: { name: true, email: true } }
+      select: {
+        ...(Object.fromEntries(updatedFields.map((field) => [field, true])) as Prisma.ServiceSelect),
+        title: true,
+        status: true,
+        assignedTo: true,
+        user: { select: { name: true, email: true } }
       }
     })
 
@@ -137,7 +165,7 @@ export async function PATCH(
     }
 
     // Authorization checks
-    const canManage = ['ADMIN', 'MANAGER'].includes(session.user.role)
+    const canManage = managerRoles.has(session.user.role)
     const isAssignedTechnician = session.user.role === 'TECHNICIAN' && currentService.assignedTo === session.user.id
 
     if (!canManage && !isAssignedTechnician) {
@@ -146,11 +174,10 @@ export async function PATCH(
 
     // Technicians can only update certain fields
     if (session.user.role === 'TECHNICIAN') {
-      const allowedFields = ['status', 'actualHours', 'partsUsed', 'notes', 'completionNotes']
       const techUpdates: any = {}
       
       for (const [key, value] of Object.entries(validatedData)) {
-        if (allowedFields.includes(key)) {
+        if (technicianFields.has(key)) {
           techUpdates[key] = value
         }
       }
@@ -160,21 +187,12 @@ export async function PATCH(
         const currentStatus = currentService.status
         const newStatus = techUpdates.status
         
-        // Define allowed transitions for technicians
-        const allowedTransitions: Record<string, string[]> = {
-          'PENDING': ['CONFIRMED', 'IN_PROGRESS'],
-          'CONFIRMED': ['IN_PROGRESS', 'ON_HOLD'],
-          'IN_PROGRESS': ['COMPLETED', 'ON_HOLD'],
-          'ON_HOLD': ['IN_PROGRESS', 'CONFIRMED'],
-          'COMPLETED': ['IN_PROGRESS'], // Allow reopening if needed
-        }
-        
         // Check if the transition is allowed
-        const allowedNextStatuses = allowedTransitions[currentStatus] || []
-        if (!allowedNextStatuses.includes(newStatus)) {
+        const allowedNextStatuses = technicianStatusTransitions[currentStatus] ?? noTransitions
+        if (!allowedNextStatuses.has(newStatus)) {
           return NextResponse.json(
             { 
-              error: `Cannot transition from ${currentStatus} to ${newStatus}. Allowed transitions: ${allowedNextStatuses.join(', ')}` 
+              error: `Cannot transition from ${currentStatus} to ${newStatus}. Allowed transitions: ${[...allowedNextStatuses].join(', ')}` 
             },
             { status: 403 }
           )
@@ -184,20 +202,12 @@ export async function PATCH(
       Object.assign(validatedData, techUpdates)
     }
 
-    // Convert scheduledDate string to Date if provided and map field names
-    const updateData: any = { ...validatedData }
-    if (updateData.scheduledDate) {
-      updateData.scheduledDate = new Date(updateData.scheduledDate)
-    }
-    
-    // Map API field names to database field names
-    if (updateData.notes !== undefined) {
-      updateData.issueDetails = updateData.notes
-      delete updateData.notes
-    }
-    if (updateData.completionNotes !== undefined) {
-      updateData.resolution = updateData.completionNotes
-      delete updateData.completionNotes
+    // Build the update in one pass, mapping API field names to database
+    // columns and converting the scheduledDate string to a Date
+    const updateData: any = {}
+    for (const [key, value] of Object.entries(validatedData)) {
+      updateData[columnForField[key] ?? key] =
+        key === 'scheduledDate' && value ? new Date(value as string) : value
     }
 
     // Update the service
@@ -239,7 +249,7 @@ export async function PATCH(
     }
 
     if (Object.keys(changes).length > 0) {
-      await logActivity({
+      logActivityInBackground({
         userId: session.user.id,
         action: 'SERVICE_UPDATE',
         resource: 'service',
@@ -301,7 +311,7 @@ export async function DELETE(
     const session = await auth()
     const { serviceId } = await params
     
-    if (!session?.user || !['ADMIN', 'MANAGER'].includes(session.user.role)) {
+    if (!session?.user || !managerRoles.has(session.user.role)) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
@@ -317,7 +327,7 @@ export async function DELETE(
     }
 
     // Only allow deletion of cancelled services or pending services
-    if (!['CANCELLED', 'PENDING'].includes(service.status)) {
+    if (!deletableStatuses.has(service.status)) {
       return NextResponse.json(
         { error: 'Only cancelled or pending services can be deleted' },
         { status: 400 }
@@ -329,7 +339,7 @@ export async function DELETE(
     })
 
     // Log the deletion
-    await logActivity({
+    logActivityInBackground({
       userId: session.user.id,
       action: 'SERVICE_CANCEL',
       resource: 'service',
@@ -3,12 +3,13 @@ import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
 import { ServiceStatus, ServiceType, Priority } from '@prisma/client'
 import { startOfDay, startOfWeek, startOfMonth, endOfDay, subDays, subWeeks, subMonths } from 'date-fns'
+import { managerRoles } from '@/lib/roles'
 
 export async function GET(request: NextRequest) {
   try {
     const session = await auth()
     
-    if (!session?.user || !['ADMIN', 'MANAGER'].includes(session.user.role)) {
+    if (!session?.user || !managerRoles.has(session.user.role)) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
@@ -2,13 +2,17 @@ import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
 import { ServiceStatus, ServiceType, Priority } from '@prisma/client'
-import { logActivity } from '@/lib/activity-logger'
+import { createActivityLogs } from '@/lib/activity-logger'
+import { staffRoles, managerRoles } from '@/lib/roles'
+
+// Fields the bulk update may change
+const bulkUpdateFields: ReadonlySet<string> = new Set(['status', 'assignedTo', 'priority', 'scheduledDate'])
 
 export async function GET(request: NextRequest) {
   try {
     const session = await auth()
     
-    if (!session?.user || !['ADMIN', 'MANAGER', 'TECHNICIAN'].includes(session.user.role)) {
+    if (!session?.user || !staffRoles.has(session.user.role)) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
@@ -63,8 +67,11 @@ export async function GET(request: NextRequest) {
     }
 
     const [services, totalCount, statusCounts] = await Promise.all([
+      // The device info blob is only shown on the service detail page, so
+      // keep it out of the list rows
       prisma.service.findMany({
         where,
+        omit: { deviceInfo: true },
         include: {
           user: {
             select: {
@@ -159,7 +166,7 @@ export async function PATCH(request: NextRequest) {
   try {
     const session = await auth()
     
-    if (!session?.user || !['ADMIN', 'MANAGER'].includes(session.user.role)) {
+    if (!session?.user || !managerRoles.has(session.user.role)) {
       return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
     }
 
@@ -180,11 +187,10 @@ export async function PATCH(request: NextRequest) {
     }
 
     // Validate allowed update fields
-    const allowedFields = ['status', 'assignedTo', 'priority', 'scheduledDate']
     const updateData: any = {}
     
     for (const [key, value] of Object.entries(updates)) {
-      if (allowedFields.includes(key)) {
+      if (bulkUpdateFields.has(key)) {
         updateData[key] = value
       }
     }
@@ -209,18 +215,16 @@ export async function PATCH(request: NextRequest) {
       }
     })
 
-    // Perform bulk update
-    const updatedServices = await prisma.service.updateMany({
-      where: { id: { in: serviceIds } },
-      data: updateData
-    })
-
-    // Log activity for each updated service
-    await Promise.all(
-      servicesBeforeUpdate.map(async (service) => {
-        await logActivity({
+    // Perform bulk update and log each updated service in one transaction
+    const [updatedServices] = await prisma.$transaction([
+      prisma.service.updateMany({
+        where: { id: { in: serviceIds } },
+        data: updateData
+      }),
+      createActivityLogs(
+        ...servicesBeforeUpdate.map((service) => ({
           userId: session.user.id,
-          action: 'SERVICE_UPDATE',
+          action: 'SERVICE_UPDATE' as const,
           resource: 'service',
           resourceId: service.id,
           details: {
@@ -239,9 +243,9 @@ export async function PATCH(request: NextRequest) {
               name: session.user.name
             }
           }
-        })
-      })
-    )
+        }))
+      )
+    ])
 
     return NextResponse.json({
       message: `Successfully updated ${updatedServices.count} services`,
@@ -2,7 +2,9 @@ import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
 import { Role } from '@prisma/client'
-import { logActivity } from '@/lib/activity-logger'
+import { createActivityLogs } from '@/lib/activity-logger'
+
+const validRoles: ReadonlySet<string> = new Set(Object.values(Role))
 
 export async function GET(request: NextRequest) {
   try {
@@ -104,7 +106,7 @@ export async function PATCH(request: NextRequest) {
       )
     }
 
-    if (!Object.values(Role).includes(role)) {
+    if (!validRoles.has(role)) {
       return NextResponse.json(
         { error: 'Invalid role' },
         { status: 400 }
@@ -117,39 +119,41 @@ export async function PATCH(request: NextRequest) {
       select: { role: true, email: true, name: true }
     })
 
-    const updatedUser = await prisma.user.update({
-      where: { id: userId },
-      data: { role },
-      select: {
-        id: true,
-        name: true,
-        email: true,
-        role: true,
-        updatedAt: true,
-      }
-    })
-
-    // Log the role change activity
-    await logActivity({
-      userId: session.user.id, // The admin who made the change
-      action: 'ROLE_CHANGE',
-      resource: 'user',
-      resourceId: userId,
-      details: {
-        targetUser: {
-          id: userId,
-          email: updatedUser.email,
-          name: updatedUser.name
-        },
-        previousRole: currentUser?.role,
-        newRole: role,
-        changedBy: {
-          id: session.user.id,
-          email: session.user.email,
-          name: session.user.name
+    // Change the role and log it in one transaction, so the audit entry
+    // commits together with the change it describes
+    const [updatedUser] = await prisma.$transaction([
+      prisma.user.update({
+        where: { id: userId },
+        data: { role },
+        select: {
+          id: true,
+          name: true,
+          email: true,
+          role: true,
+          updatedAt: true,
         }
-      }
-    })
+      }),
+      createActivityLogs({
+        userId: session.user.id, // The admin who made the change
+        action: 'ROLE_CHANGE',
+        resource: 'user',
+        resourceId: userId,
+        details: {
+          targetUser: {
+            id: userId,
+            email: currentUser?.email,
+            name: currentUser?.name
+          },
+          previousRole: currentUser?.role,
+          newRole: role,
+          changedBy: {
+            id: session.user.id,
+            email: session.user.email,
+            name: session.user.name
+          }
+        }
+      })
+    ])
 
     return NextResponse.json(updatedUser)
   } catch (error) {
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { prisma } from '@/lib/db'
 import { auth } from '@/lib/auth'
+import { lineItemsWithProduct } from '@/lib/product-queries'
 
 export async function GET() {
   try {
@@ -13,18 +14,7 @@ export async function GET() {
     const cart = await prisma.cart.findUnique({
       where: { userId: session.user.id },
       include: {
-        items: {
-          include: {
-            product: {
-              include: {
-                images: {
-                  orderBy: { position: 'asc' },
-                  take: 1,
-                }
-              }
-            }
-          }
-        }
+        items: lineItemsWithProduct
       }
     })
     
@@ -53,17 +43,13 @@ export async function POST(request: NextRequest) {
     
     const { items } = await request.json()
     
-    // Get or create cart
-    let cart = await prisma.cart.findUnique({
-      where: { userId: session.user.id }
+    // Get or create cart in a single round trip
+    const cart = await prisma.cart.upsert({
+      where: { userId: session.user.id },
+      update: {},
+      create: { userId: session.user.id },
     })
     
-    if (!cart) {
-      cart = await prisma.cart.create({
-        data: { userId: session.user.id }
-      })
-    }
-    
     // Clear existing items
     await prisma.cartItem.deleteMany({
       where: { cartId: cart.id }
@@ -103,17 +89,13 @@ export async function PUT(request: NextRequest) {
     
     const { productId, quantity } = await request.json()
     
-    // Get or create cart
-    let cart = await prisma.cart.findUnique({
-      where: { userId: session.user.id }
+    // Get or create cart in a single round trip
+    const cart = await prisma.cart.upsert({
+      where: { userId: session.user.id },
+      update: {},
+      create: { userId: session.user.id },
     })
     
-    if (!cart) {
-      cart = await prisma.cart.create({
-        data: { userId: session.user.id }
-      })
-    }
-    
     if (quantity <= 0) {
       // Remove item
       await prisma.cartItem.deleteMany({
@@ -1,12 +1,12 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { prisma } from '@/lib/db'
+import { prismaRead } from '@/lib/db'
 
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url)
     const includeChildren = searchParams.get('includeChildren') === 'true'
     
-    const categories = await prisma.category.findMany({
+    const categories = await prismaRead.category.findMany({
       where: {
         isActive: true,
         parentId: includeChildren ? undefined : null, // Only root categories by default
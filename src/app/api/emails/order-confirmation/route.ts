@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { Resend } from 'resend'
 import { prisma } from '@/lib/db'
+import { lineItemsWithProduct } from '@/lib/product-queries'
 
 const resend = new Resend(process.env.RESEND_API_KEY)
 
@@ -19,18 +20,7 @@ export async function POST(request: NextRequest) {
     const order = await prisma.order.findUnique({
       where: { id: orderId },
       include: {
-        items: {
-          include: {
-            product: {
-              include: {
-                images: {
-                  orderBy: { position: 'asc' },
-                  take: 1,
-                }
-              }
-            }
-          }
-        },
+        items: lineItemsWithProduct,
         shippingAddress: true,
         user: {
           select: {
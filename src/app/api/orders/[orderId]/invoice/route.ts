@@ -1,6 +1,15 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { prisma } from '@/lib/db'
 import { auth } from '@/lib/auth'
+import { OrderStatus } from '@prisma/client'
+
+// Order statuses an invoice can be generated for
+const invoiceableStatuses: ReadonlySet<OrderStatus> = new Set<OrderStatus>([
+  'CONFIRMED',
+  'PROCESSING',
+  'SHIPPED',
+  'DELIVERED',
+])
 
 export async function GET(
   request: NextRequest,
@@ -53,7 +62,7 @@ export async function GET(
     }
     
     // Only generate invoices for completed/shipped orders
-    if (!['CONFIRMED', 'PROCESSING', 'SHIPPED', 'DELIVERED'].includes(order.status)) {
+    if (!invoiceableStatuses.has(order.status)) {
       return NextResponse.json(
         { error: 'Invoice not available for this order status' },
         { status: 400 }
@@ -1,6 +1,20 @@
 import { NextRequest, NextResponse } from 'next/server'
+import { Prisma } from '@prisma/client'
 import { prisma } from '@/lib/db'
 import { auth } from '@/lib/auth'
+import { lineItemsWithProduct } from '@/lib/product-queries'
+
+const orderDetailInclude = {
+  items: lineItemsWithProduct,
+  shippingAddress: true,
+  user: {
+    select: {
+      id: true,
+      name: true,
+      email: true,
+    }
+  }
+} satisfies Prisma.OrderInclude
 
 export async function GET(
   request: NextRequest,
@@ -23,28 +37,7 @@ export async function GET(
         id: orderId,
         userId: session.user.id,
       },
-      include: {
-        items: {
-          include: {
-            product: {
-              include: {
-                images: {
-                  orderBy: { position: 'asc' },
-                  take: 1,
-                }
-              }
-            }
-          }
-        },
-        shippingAddress: true,
-        user: {
-          select: {
-            id: true,
-            name: true,
-            email: true,
-          }
-        }
-      },
+      include: orderDetailInclude,
     })
     
     if (!order) {
@@ -109,28 +102,7 @@ export async function PUT(
     const updatedOrder = await prisma.order.update({
       where: { id: orderId },
       data: updateData,
-      include: {
-        items: {
-          include: {
-            product: {
-              include: {
-                images: {
-                  orderBy: { position: 'asc' },
-                  take: 1,
-                }
-              }
-            }
-          }
-        },
-        shippingAddress: true,
-        user: {
-          select: {
-            id: true,
-            name: true,
-            email: true,
-          }
-        }
-      },
+      include: orderDetailInclude,
     })
     
     return NextResponse.json(updatedOrder)
@@ -1,6 +1,36 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { prisma } from '@/lib/db'
 import { auth } from '@/lib/auth'
+import { Prisma } from '@prisma/client'
+import { primaryImage } from '@/lib/product-queries'
+
+// Everything the order history page renders, and nothing else. Prisma loads
+// the items, products and images for the whole page of orders in one batched
+// query per relation, so keeping each level narrow is what matters here.
+const orderListSelect = {
+  id: true,
+  orderNumber: true,
+  status: true,
+  paymentStatus: true,
+  total: true,
+  createdAt: true,
+  trackingNumber: true,
+  items: {
+    select: {
+      id: true,
+      quantity: true,
+      price: true,
+      product: {
+        select: {
+          id: true,
+          name: true,
+          slug: true,
+          images: { ...primaryImage, select: { url: true, altText: true } },
+        },
+      },
+    },
+  },
+} satisfies Prisma.OrderSelect
 
 export async function GET() {
   try {
@@ -15,21 +45,7 @@ export async function GET() {
     
     const orders = await prisma.order.findMany({
       where: { userId: session.user.id },
-      include: {
-        items: {
-          include: {
-            product: {
-              include: {
-                images: {
-                  orderBy: { position: 'asc' },
-                  take: 1,
-                }
-              }
-            }
-          }
-        },
-        shippingAddress: true,
-      },
+      select: orderListSelect,
       orderBy: { createdAt: 'desc' },
     })
     
@@ -90,37 +106,37 @@ export async function POST(request: NextRequest) {
       }
     })
     
-    // Generate order number
-    const orderNumber = `FTP-${Date.now()}-${Math.random().toString(36).substr(2, 9).toUpperCase()}`
+    // The subtotal is summed from the line items being stored rather than
+    // taken from the client's summary, in Decimal so cents don't drift. Tax
+    // and shipping are still the client's figures
+    const lineItems = items.map((item: any) => ({
+      productId: item.productId,
+      quantity: item.quantity,
+      price: new Prisma.Decimal(item.price),
+    }))
+    const subtotal = lineItems.reduce(
+      (sum: Prisma.Decimal, item: { quantity: number; price: Prisma.Decimal }) =>
+        sum.add(item.price.mul(item.quantity)),
+      new Prisma.Decimal(0)
+    )
+    const total = subtotal.add(orderSummary.tax).add(orderSummary.shipping)
     
-    // Create order
+    // Create order; the order number is assigned by the database default
     const order = await prisma.order.create({
       data: {
-        orderNumber,
         userId: session.user.id,
         status: 'PENDING',
-        subtotal: orderSummary.subtotal,
+        subtotal,
         tax: orderSummary.tax,
         shipping: orderSummary.shipping,
-        total: orderSummary.total,
+        total,
         shippingAddressId: shippingAddress.id,
         paymentStatus: 'PENDING',
         items: {
-          create: items.map((item: any) => ({
-            productId: item.productId,
-            quantity: item.quantity,
-            price: item.price,
-          }))
+          create: lineItems
         }
       },
-      include: {
-        items: {
-          include: {
-            product: true
-          }
-        },
-        shippingAddress: true,
-      }
+      select: { id: true, orderNumber: true }
     })
     
     return NextResponse.json({
@@ -1,5 +1,45 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { prisma } from '@/lib/db'
+import { Prisma } from '@prisma/client'
+import { prismaRead } from '@/lib/db'
+import { activeProduct, primaryImage } from '@/lib/product-queries'
+
+// Query shapes are built once per module instead of on every request;
+// only the slug / category parameters change between calls.
+const productDetailInclude = {
+  category: {
+    select: {
+      id: true,
+      name: true,
+      slug: true,
+    }
+  },
+  images: {
+    orderBy: { position: 'asc' },
+  },
+  reviews: {
+    where: { isVisible: true },
+    include: {
+      user: {
+        select: {
+          name: true,
+          image: true,
+        }
+      }
+    },
+    orderBy: { createdAt: 'desc' },
+  },
+  _count: {
+    select: {
+      reviews: true,
+    }
+  }
+} satisfies Prisma.ProductInclude
+
+const relatedProductInclude = {
+  images: primaryImage,
+} satisfies Prisma.ProductInclude
+
+const RELATED_PRODUCTS_LIMIT = 4
 
 export async function GET(
   request: NextRequest,
@@ -8,40 +48,12 @@ export async function GET(
   try {
     const { slug } = await params
     
-    const product = await prisma.product.findUnique({
+    const product = await prismaRead.product.findUnique({
       where: {
         slug,
-        isActive: true,
-      },
-      include: {
-        category: {
-          select: {
-            id: true,
-            name: true,
-            slug: true,
-          }
-        },
-        images: {
-          orderBy: { position: 'asc' },
-        },
-        reviews: {
-          where: { isVisible: true },
-          include: {
-            user: {
-              select: {
-                name: true,
-                image: true,
-              }
-            }
-          },
-          orderBy: { createdAt: 'desc' },
-        },
-        _count: {
-          select: {
-            reviews: true,
-          }
-        }
+        ...activeProduct,
       },
+      include: productDetailInclude,
     })
     
     if (!product) {
@@ -57,19 +69,14 @@ export async function GET(
       : 0
     
     // Get related products from the same category
-    const relatedProducts = await prisma.product.findMany({
+    const relatedProducts = await prismaRead.product.findMany({
       where: {
         categoryId: product.categoryId,
         id: { not: product.id },
-        isActive: true,
-      },
-      include: {
-        images: {
-          orderBy: { position: 'asc' },
-          take: 1,
-        },
+        ...activeProduct,
       },
-      take: 4,
+      include: relatedProductInclude,
+      take: RELATED_PRODUCTS_LIMIT,
       orderBy: { createdAt: 'desc' },
     })
     
@@ -1,5 +1,64 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { prisma } from '@/lib/db'
+import { Prisma } from '@prisma/client'
+import { prismaRead } from '@/lib/db'
+import { activeProduct, primaryImage } from '@/lib/product-queries'
+
+// List pages only render product cards, so fetch just the columns a card
+// needs instead of hydrating full rows (description, specifications, cost
+// price, SEO fields) for every product on the page.
+const productListSelect = {
+  id: true,
+  name: true,
+  slug: true,
+  shortDescription: true,
+  price: true,
+  comparePrice: true,
+  stock: true,
+  brand: true,
+  featured: true,
+  category: {
+    select: {
+      id: true,
+      name: true,
+      slug: true,
+    }
+  },
+  images: {
+    ...primaryImage,
+    select: {
+      url: true,
+      altText: true,
+    },
+  },
+  _count: {
+    select: {
+      reviews: true,
+    }
+  }
+} satisfies Prisma.ProductSelect
+
+type ProductOrderBy = Prisma.ProductOrderByWithRelationInput
+
+// sortBy query value -> orderBy builder; anything unknown sorts by newest
+const sortBuilders = new Map<string, (direction: Prisma.SortOrder) => ProductOrderBy>([
+  ['price', (direction) => ({ price: direction })],
+  ['name', (direction) => ({ name: direction })],
+  ['createdAt', (direction) => ({ createdAt: direction })],
+])
+const defaultSortBuilder = sortBuilders.get('createdAt')!
+
+// Price bounds are compared against a Decimal(10,2) column; parse them as
+// Decimal once so they bind as numerics without a float round-trip. NaN,
+// Infinity and negative bounds are ignored like any other unparsable value
+function parsePrice(value: string | null): Prisma.Decimal | undefined {
+  if (!value) return undefined
+  try {
+    const price = new Prisma.Decimal(value)
+    return price.isFinite() && !price.isNegative() ? price : undefined
+  } catch {
+    return undefined
+  }
+}
 
 export async function GET(request: NextRequest) {
   try {
@@ -11,8 +70,8 @@ export async function GET(request: NextRequest) {
     const search = searchParams.get('search')
     const category = searchParams.get('category')
     const brand = searchParams.get('brand')
-    const minPrice = searchParams.get('minPrice')
-    const maxPrice = searchParams.get('maxPrice')
+    const minPrice = parsePrice(searchParams.get('minPrice'))
+    const maxPrice = parsePrice(searchParams.get('maxPrice'))
     const featured = searchParams.get('featured')
     const sortBy = searchParams.get('sortBy') || 'createdAt'
     const sortOrder = searchParams.get('sortOrder') || 'desc'
@@ -22,14 +81,14 @@ export async function GET(request: NextRequest) {
     
     // Build where clause
     const where: any = {
-      isActive: true,
+      ...activeProduct,
     }
     
-    // Search filter
+    // Search filter - every branch has an index, so Postgres can combine
+    // them instead of scanning the catalog
     if (search) {
       where.OR = [
         { name: { contains: search, mode: 'insensitive' } },
-        { description: { contains: search, mode: 'insensitive' } },
         { tags: { has: search } },
         { brand: { contains: search, mode: 'insensitive' } },
       ]
@@ -42,19 +101,18 @@ export async function GET(request: NextRequest) {
       }
     }
     
-    // Brand filter
+    // Brand filter - whole-value match in any casing (?brand=nvidia finds
+    // NVIDIA). This is an ILIKE without wildcards, which the brand trigram
+    // index serves
     if (brand) {
-      where.brand = {
-        contains: brand,
-        mode: 'insensitive'
-      }
+      where.brand = { equals: brand, mode: 'insensitive' }
     }
     
     // Price filters
     if (minPrice || maxPrice) {
       where.price = {}
-      if (minPrice) where.price.gte = parseFloat(minPrice)
-      if (maxPrice) where.price.lte = parseFloat(maxPrice)
+      if (minPrice) where.price.gte = minPrice
+      if (maxPrice) where.price.lte = maxPrice
     }
     
     // Featured filter
@@ -62,48 +120,22 @@ export async function GET(request: NextRequest) {
       where.featured = true
     }
     
-    // Build orderBy
-    const orderBy: any = {}
-    switch (sortBy) {
-      case 'price':
-        orderBy.price = sortOrder
-        break
-      case 'name':
-        orderBy.name = sortOrder
-        break
-      case 'createdAt':
-      default:
-        orderBy.createdAt = sortOrder
-        break
-    }
+    // Build orderBy - id breaks ties in the same direction so pages stay
+    // stable when several products share a price, name or timestamp
+    const buildSort = sortBuilders.get(sortBy) ?? defaultSortBuilder
+    const direction: Prisma.SortOrder = sortOrder === 'asc' ? 'asc' : 'desc'
+    const orderBy: ProductOrderBy[] = [buildSort(direction), { id: direction }]
     
     // Fetch products with pagination
     const [products, totalCount] = await Promise.all([
-      prisma.product.findMany({
+      prismaRead.product.findMany({
         where,
         orderBy,
         skip,
         take: limit,
-        include: {
-          category: {
-            select: {
-              id: true,
-              name: true,
-              slug: true,
-            }
-          },
-          images: {
-            orderBy: { position: 'asc' },
-            take: 1,
-          },
-          _count: {
-            select: {
-              reviews: true,
-            }
-          }
-        },
+        select: productListSelect,
       }),
-      prisma.product.count({ where }),
+      prismaRead.product.count({ where }),
     ])
     
     // Calculate pagination info
@@ -107,10 +107,7 @@ export async function PATCH(
     // Update the service
     const service = await prisma.service.update({
       where: { id: serviceId },
-      data: {
-        ...validatedData,
-        updatedAt: new Date()
-      },
+      data: validatedData,
       include: {
         user: {
           select: {
@@ -205,8 +202,7 @@ export async function DELETE(
     const service = await prisma.service.update({
       where: { id: serviceId },
       data: {
-        status: 'CANCELLED',
-        updatedAt: new Date()
+        status: 'CANCELLED'
       },
       include: {
         user: {
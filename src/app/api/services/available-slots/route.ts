@@ -14,8 +14,12 @@ export async function GET(request: NextRequest) {
 
     const selectedDate = new Date(date)
     
+    // Read the clock once for both the past-date and minimum-notice checks
+    const now = new Date()
+    const minimumNotice = now.getTime() + 2 * 60 * 60 * 1000 // 2 hours from now
+
     // Check if date is in the past
-    const today = new Date()
+    const today = new Date(now)
     today.setHours(0, 0, 0, 0)
     if (selectedDate < today) {
       return NextResponse.json({ error: 'Cannot book services for past dates' }, { status: 400 })
@@ -71,25 +75,26 @@ export async function GET(request: NextRequest) {
 
     const requestedDuration = serviceType ? serviceDurations[serviceType as keyof typeof serviceDurations] || 60 : 60
 
+    // Work out each booking's time range once, rather than again for every
+    // slot it is checked against
+    const bookedRanges = existingBookings.map(booking => {
+      const start = booking.scheduledDate.getTime()
+      const duration = serviceDurations[booking.type] || 60
+      return { start, end: start + duration * 60000 }
+    })
+
     // Filter out unavailable slots
     const availableSlots = allSlots.filter(slot => {
-      // Check if this slot conflicts with existing bookings
-      const hasConflict = existingBookings.some(booking => {
-        const bookingStart = new Date(booking.scheduledDate)
-        const bookingDuration = serviceDurations[booking.type] || 60
-        const bookingEnd = new Date(bookingStart.getTime() + bookingDuration * 60000)
+      const slotStart = slot.getTime()
+      const slotEnd = slotStart + requestedDuration * 60000
 
-        const slotEnd = new Date(slot.getTime() + requestedDuration * 60000)
-
-        // Check for overlap
-        return (slot < bookingEnd && slotEnd > bookingStart)
-      })
+      // Check if this slot overlaps any existing booking
+      const hasConflict = bookedRanges.some(range =>
+        slotStart < range.end && slotEnd > range.start
+      )
 
       // Also check if slot is too close to current time (at least 2 hours notice)
-      const now = new Date()
-      const minimumNotice = new Date(now.getTime() + 2 * 60 * 60 * 1000) // 2 hours from now
-
-      return !hasConflict && slot >= minimumNotice
+      return !hasConflict && slotStart >= minimumNotice
     })
 
     // Format slots for response
@@ -2,6 +2,34 @@ import { NextRequest, NextResponse } from 'next/server'
 import { stripe } from '@/lib/stripe'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
+import { Prisma } from '@prisma/client'
+
+// Shared by the ownership check and the reload after confirming, so the
+// already-confirmed and newly-confirmed responses have the same shape. The
+// line items only need enough of each product to describe the order, not the
+// full row with its description and specifications
+const confirmOrderInclude = {
+  items: {
+    include: {
+      product: {
+        select: {
+          id: true,
+          name: true,
+          slug: true,
+          price: true
+        }
+      }
+    }
+  },
+  shippingAddress: true,
+  user: {
+    select: {
+      id: true,
+      name: true,
+      email: true
+    }
+  },
+} satisfies Prisma.OrderInclude
 
 export async function POST(request: NextRequest) {
   try {
@@ -22,14 +50,7 @@ export async function POST(request: NextRequest) {
         id: orderId,
         userId: session.user.id,
       },
-      include: {
-        items: {
-          include: {
-            product: true
-          }
-        },
-        shippingAddress: true,
-      }
+      include: confirmOrderInclude
     })
     
     if (!order) {
@@ -39,6 +60,16 @@ export async function POST(request: NextRequest) {
       )
     }
     
+    // Confirming is idempotent: a retried request for an order that is
+    // already paid returns without calling Stripe or writing anything
+    if (order.paymentStatus === 'COMPLETED') {
+      return NextResponse.json({
+        success: true,
+        order,
+        message: 'Payment already confirmed'
+      })
+    }
+    
     // For demo purposes, we'll simulate a successful payment
     // In production, you would verify the payment with Stripe
     try {
@@ -50,38 +81,86 @@ export async function POST(request: NextRequest) {
       const paymentSuccessful = true // Demo mode
       
       if (paymentSuccessful) {
-        // Update order status
-        const updatedOrder = await prisma.order.update({
-          where: { id: orderId },
-          data: {
-            status: 'CONFIRMED',
-            paymentStatus: 'COMPLETED',
-            paymentMethod: 'card',
-          },
-          include: {
-            items: {
-              include: {
-                product: true
+        // The claim, the stock decrement and the shortage note commit
+        // together. If any of them fails the order is left unpaid, so a
+        // retry redoes all of it instead of finding it already COMPLETED
+        const claimed = await prisma.$transaction(async (tx) => {
+          // Update order status. The paymentStatus guard makes this a claim:
+          // if two confirmations race, only one of them moves the order to
+          // COMPLETED and goes on to decrement stock and send the email
+          const { count } = await tx.order.updateMany({
+            where: { id: orderId, paymentStatus: { not: 'COMPLETED' } },
+            data: {
+              status: 'CONFIRMED',
+              paymentStatus: 'COMPLETED',
+              paymentMethod: 'card',
+            }
+          })
+          if (count === 0) return false
+          
+          // Update product stock for every line in one statement. The rows are
+          // locked before their stock is read, so concurrent checkouts can't
+          // both sell the last units. The payment is already taken, so a short
+          // product is clamped to zero rather than skipped, and the shortfall
+          // is returned so the order can be flagged
+          const orderedQuantities = Prisma.join(
+            order.items.map(item => Prisma.sql`(${item.productId}, ${item.quantity}::integer)`)
+          )
+          const stockUpdates = await tx.$queryRaw<{ name: string; shortfall: number }[]>`
+            WITH ordered AS (
+              SELECT id, SUM(quantity)::integer as quantity
+              FROM (VALUES ${orderedQuantities}) AS items(id, quantity)
+              GROUP BY id
+            ),
+            locked AS (
+              SELECT p."id", p."stock"
+              FROM "Product" p
+              JOIN ordered ON ordered.id = p."id"
+              FOR UPDATE OF p
+            )
+            UPDATE "Product" p SET
+              "stock" = GREATEST(locked."stock" - ordered.quantity, 0),
+              "updatedAt" = NOW()
+            FROM locked
+            JOIN ordered ON ordered.id = locked."id"
+            WHERE p."id" = locked."id"
+            RETURNING p."name", GREATEST(ordered.quantity - locked."stock", 0)::integer as shortfall
+          `
+          // An oversold order is flagged in the same transaction: its
+          // stockShortfall is what the admin order list filters on, and the
+          // note says which products ran short
+          const shortages = stockUpdates.filter(update => update.shortfall > 0)
+          if (shortages.length > 0) {
+            const shortageNote = `Oversold at payment: ${shortages
+              .map(update => `${update.name} short by ${update.shortfall}`)
+              .join(', ')}`
+            console.warn(`${shortageNote} (order ${order.orderNumber})`)
+            await tx.order.update({
+              where: { id: orderId },
+              data: {
+                stockShortfall: shortages.reduce((sum, update) => sum + update.shortfall, 0),
+                adminNotes: [order.adminNotes, shortageNote].filter(Boolean).join('\n')
               }
-            },
-            shippingAddress: true,
-            user: true,
+            })
           }
+          return true
         })
         
-        // Update product stock
-        for (const item of order.items) {
-          await prisma.product.update({
-            where: { id: item.productId },
-            data: {
-              stock: {
-                decrement: item.quantity
-              }
-            }
+        const updatedOrder = await prisma.order.findUniqueOrThrow({
+          where: { id: orderId },
+          include: confirmOrderInclude
+        })
+        
+        if (!claimed) {
+          return NextResponse.json({
+            success: true,
+            order: updatedOrder,
+            message: 'Payment already confirmed'
           })
         }
         
-        // Send order confirmation email (we'll implement this next)
+        // Send order confirmation email, only once the confirmation has
+        // committed (we'll implement this next)
         try {
           await fetch(`${process.env.NEXTAUTH_URL}/api/emails/order-confirmation`, {
             method: 'POST',
@@ -14,14 +14,15 @@ export async function POST(request: NextRequest) {
       )
     }
     
-    const { orderId, amount } = await request.json()
+    const { orderId } = await request.json()
     
     // Validate order belongs to user
     const order = await prisma.order.findFirst({
       where: {
         id: orderId,
         userId: session.user.id,
-      }
+      },
+      select: { id: true, orderNumber: true, total: true }
     })
     
     if (!order) {
@@ -31,6 +32,10 @@ export async function POST(request: NextRequest) {
       )
     }
     
+    // Charge the stored order total. It is converted to cents with exact
+    // decimal arithmetic, not from a float sent by the client
+    const amount = order.total.mul(100).toDecimalPlaces(0).toNumber()
+    
     // Create payment intent
     const paymentIntent = await stripe.paymentIntents.create({
       amount: amount, // Amount in cents
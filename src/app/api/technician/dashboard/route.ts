@@ -2,12 +2,13 @@ import { NextRequest, NextResponse } from 'next/server'
 import { auth } from '@/lib/auth'
 import { prisma } from '@/lib/db'
 import { startOfDay, startOfWeek, endOfDay, subDays } from 'date-fns'
+import { technicianAreaRoles } from '@/lib/roles'
 
 export async function GET(request: NextRequest) {
   try {
     const session = await auth()
     
-    if (!session?.user || !['TECHNICIAN', 'MANAGER'].includes(session.user.role)) {
+    if (!session?.user || !technicianAreaRoles.has(session.user.role)) {
       return NextResponse.json({ error: 'Unauthorized - Technician access required' }, { status: 401 })
     }
 
@@ -181,26 +182,27 @@ export async function GET(request: NextRequest) {
       })
     ])
 
-    // Calculate performance metrics
-    const avgEstimatedHours = performanceStats.length > 0 
-      ? performanceStats.reduce((sum, s) => sum + (s.estimatedHours || 0), 0) / performanceStats.length 
-      : 0
+    // Calculate performance metrics, totalling hours and completion days in
+    // a single pass over the completed services
+    let totalEstimatedHours = 0
+    let totalActualHours = 0
+    let totalCompletionDays = 0
+    for (const s of performanceStats) {
+      totalEstimatedHours += s.estimatedHours || 0
+      totalActualHours += s.actualHours || 0
+      totalCompletionDays += Math.ceil((s.updatedAt.getTime() - s.createdAt.getTime()) / (1000 * 60 * 60 * 24))
+    }
 
-    const avgActualHours = performanceStats.length > 0
-      ? performanceStats.reduce((sum, s) => sum + (s.actualHours || 0), 0) / performanceStats.length
-      : 0
+    const completedCount = performanceStats.length
+    const avgEstimatedHours = completedCount > 0 ? totalEstimatedHours / completedCount : 0
+    const avgActualHours = completedCount > 0 ? totalActualHours / completedCount : 0
 
     const efficiencyRate = avgEstimatedHours > 0 
       ? Math.round((avgEstimatedHours / avgActualHours) * 100) 
       : 0
 
-    // Calculate average completion time in days
-    const avgCompletionDays = performanceStats.length > 0
-      ? performanceStats.reduce((sum, s) => {
-          const days = Math.ceil((new Date(s.updatedAt).getTime() - new Date(s.createdAt).getTime()) / (1000 * 60 * 60 * 24))
-          return sum + days
-        }, 0) / performanceStats.length
-      : 0
+    // Average completion time in days
+    const avgCompletionDays = completedCount > 0 ? totalCompletionDays / completedCount : 0
 
     // Process status counts into a more usable format
     const statusCounts = servicesByStatus.reduce((acc, item) => {
@@ -0,0 +1,18 @@
+// Runs once when a server instance starts. Connecting here means the query
+// engine is started and the pool is open before the first request arrives,
+// instead of the first checkout or admin action paying for it.
+export async function register() {
+  // Prisma only runs in the Node.js runtime, not the edge middleware
+  if (process.env.NEXT_RUNTIME !== 'nodejs') return
+
+  const { prisma, prismaRead } = await import('@/lib/db')
+
+  try {
+    await Promise.all(
+      prismaRead === prisma ? [prisma.$connect()] : [prisma.$connect(), prismaRead.$connect()]
+    )
+  } catch (error) {
+    // Requests will connect lazily as before, so don't fail startup
+    console.error('Database warm-up failed:', error)
+  }
+}
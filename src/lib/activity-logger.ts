@@ -1,3 +1,4 @@
+import { after } from 'next/server'
 import { prisma } from '@/lib/db'
 import { ActivityAction } from '@prisma/client'
 
@@ -11,20 +12,39 @@ interface LogActivityOptions {
   userAgent?: string
 }
 
-export async function logActivity(options: LogActivityOptions) {
-  try {
-    await prisma.activityLog.create({
-      data: {
-        userId: options.userId,
-        action: options.action,
-        resource: options.resource,
-        resourceId: options.resourceId,
-        details: options.details,
-        ipAddress: options.ipAddress,
-        userAgent: options.userAgent,
-      }
-    })
-  } catch (error) {
-    console.error('Failed to log activity:', error)
+function toActivityLogData(options: LogActivityOptions) {
+  return {
+    userId: options.userId,
+    action: options.action,
+    resource: options.resource,
+    resourceId: options.resourceId,
+    details: options.details,
+    ipAddress: options.ipAddress,
+    userAgent: options.userAgent,
   }
+}
+
+// Returns the insert without running it, for use inside prisma.$transaction
+// so the log entries commit together with the change they describe
+export function createActivityLogs(...entries: LogActivityOptions[]) {
+  return prisma.activityLog.createMany({
+    data: entries.map(toActivityLogData)
+  })
+}
+
+// Defers the insert until after the response has been sent, so the request
+// doesn't wait on the audit write. Several entries are written together in
+// a single createMany.
+export function logActivityInBackground(...entries: LogActivityOptions[]) {
+  if (entries.length === 0) return
+
+  after(async () => {
+    try {
+      await prisma.activityLog.createMany({
+        data: entries.map(toActivityLogData)
+      })
+    } catch (error) {
+      console.error('Failed to log activity:', error)
+    }
+  })
 }
\ No newline at end of file
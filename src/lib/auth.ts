@@ -5,7 +5,23 @@ import GitHubProvider from "next-auth/providers/github"
 import CredentialsProvider from "next-auth/providers/credentials"
 import { compare } from "bcryptjs"
 import { prisma } from "./db"
-import { logActivity } from "./activity-logger"
+import { logActivityInBackground } from "./activity-logger"
+
+// The jwt and session callbacks run on every auth() call, so their trace
+// logging is off unless AUTH_DEBUG is set
+const debugLog: (...args: unknown[]) => void =
+  process.env.AUTH_DEBUG === "true" ? console.log : () => {}
+
+// Compares every character of the secret whatever the first mismatch is, so
+// response time doesn't reveal how much of it matched. Kept dependency-free
+// because this module is also bundled into the edge middleware.
+function constantTimeEqual(input: string, secret: string) {
+  let mismatch = input.length ^ secret.length
+  for (let i = 0; i < secret.length; i++) {
+    mismatch |= (input.charCodeAt(i) || 0) ^ secret.charCodeAt(i)
+  }
+  return mismatch === 0
+}
 
 export const { handlers, auth, signIn, signOut } = NextAuth({
   session: { strategy: "jwt" },
@@ -29,22 +45,26 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
           return null
         }
 
+        // Emails are stored lowercased, so an exact match stays on the
+        // unique index instead of needing a case-insensitive scan
         const user = await prisma.user.findUnique({
           where: {
-            email: credentials.email as string
-          }
+            email: (credentials.email as string).toLowerCase()
+          },
+          select: { id: true, email: true, name: true, role: true }
         })
 
-        if (!user) {
-          return null
-        }
-
         // For demo purposes, we'll create a simple password check
         // In production, you'd hash passwords properly
-        const isPasswordValid = credentials.password === "password123" || 
-                               (user.email === "admin@finetunepc.com" && credentials.password === "admin123")
+        // Both comparisons always run, and before the user check, so an unknown
+        // email and a wrong password take the same time to reject
+        const password = credentials.password as string
+        const matchesDemoPassword = constantTimeEqual(password, "password123")
+        const matchesAdminPassword = constantTimeEqual(password, "admin123")
+        const isPasswordValid = matchesDemoPassword || 
+                               (user?.email === "admin@finetunepc.com" && matchesAdminPassword)
 
-        if (!isPasswordValid) {
+        if (!user || !isPasswordValid) {
           return null
         }
 
@@ -59,7 +79,7 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
   ],
   callbacks: {
     async jwt({ token, user, trigger }) {
-      console.log('🔑 JWT Callback:', { 
+      debugLog('🔑 JWT Callback:', { 
         trigger,
         hasUser: !!user, 
         userId: user?.id, 
@@ -70,35 +90,36 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
       
       // On initial sign in, user object is present
       if (user) {
-        console.log('👤 Setting token from user object:', user.id)
+        debugLog('👤 Setting token from user object:', user.id)
         token.userId = user.id
         token.role = user.role
         token.email = user.email
       } 
       // On subsequent requests, user is null but token should have userId
       else if (token.email && !token.userId) {
-        console.log('🔍 Looking up user by email:', token.email)
+        debugLog('🔍 Looking up user by email:', token.email)
         try {
           const dbUser = await prisma.user.findUnique({
-            where: { email: token.email as string }
+            where: { email: (token.email as string).toLowerCase() },
+            select: { id: true, role: true }
           })
           if (dbUser) {
-            console.log('✅ Found user in database:', dbUser.id)
+            debugLog('✅ Found user in database:', dbUser.id)
             token.userId = dbUser.id
             token.role = dbUser.role
           } else {
-            console.log('❌ User not found in database for email:', token.email)
+            debugLog('❌ User not found in database for email:', token.email)
           }
         } catch (error) {
           console.error('Error looking up user in JWT callback:', error)
         }
       }
       
-      console.log('🔑 JWT Callback Result:', { userId: token.userId, role: token.role })
+      debugLog('🔑 JWT Callback Result:', { userId: token.userId, role: token.role })
       return token
     },
     async session({ session, token }) {
-      console.log('🏠 Session Callback:', { 
+      debugLog('🏠 Session Callback:', { 
         tokenUserId: token.userId, 
         tokenRole: token.role,
         tokenEmail: token.email 
@@ -112,7 +133,7 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
         }
       }
       
-      console.log('🏠 Session Result:', { 
+      debugLog('🏠 Session Result:', { 
         userId: session.user.id, 
         userEmail: session.user.email,
         userRole: session.user.role 
@@ -121,7 +142,7 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
       return session
     },
     async signIn({ user, account, profile }) {
-      console.log('🔐 SignIn Callback:', { 
+      debugLog('🔐 SignIn Callback:', { 
         provider: account?.provider, 
         userEmail: user.email,
         userName: user.name 
@@ -129,31 +150,26 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
       
       // For all providers, ensure user exists in database
       if (user.email) {
+        const email = user.email.toLowerCase()
         try {
-          const existingUser = await prisma.user.findUnique({
-            where: { email: user.email }
+          // Find or create in one statement, so two concurrent first sign-ins
+          // with the same email can't race on the unique constraint
+          const dbUser = await prisma.user.upsert({
+            where: { email },
+            update: {},
+            create: {
+              email,
+              name: user.name || "",
+              image: user.image,
+              emailVerified: new Date(),
+              role: "USER"
+            },
+            select: { id: true, role: true }
           })
-
-          if (!existingUser) {
-            console.log('👤 Creating new user:', user.email)
-            const newUser = await prisma.user.create({
-              data: {
-                email: user.email,
-                name: user.name || "",
-                image: user.image,
-                emailVerified: new Date(),
-                role: "USER"
-              }
-            })
-            // Update the user object with the database ID
-            user.id = newUser.id
-            user.role = newUser.role
-          } else {
-            console.log('👤 Found existing user:', user.email)
-            // Update the user object with the database info
-            user.id = existingUser.id
-            user.role = existingUser.role
-          }
+          debugLog('👤 Resolved user:', user.email)
+          // Update the user object with the database info
+          user.id = dbUser.id
+          user.role = dbUser.role
         } catch (error) {
           console.error("Error handling user in signIn:", error)
           return false
@@ -171,7 +187,7 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
       console.log("User signed in:", message.user.email)
       
       if (message.user?.id) {
-        await logActivity({
+        logActivityInBackground({
           userId: message.user.id,
           action: 'LOGIN',
           resource: 'authentication',
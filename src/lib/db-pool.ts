@@ -1,27 +1,9 @@
-import { PrismaClient } from '@prisma/client'
+import { prisma } from '@/lib/db'
 
-declare global {
-  var __prisma: PrismaClient | undefined
-}
-
-// Database connection configuration with pooling
-const createPrismaClient = () => {
-  return new PrismaClient({
-    log: process.env.NODE_ENV === 'development' ? ['query', 'error', 'warn'] : ['error'],
-    datasources: {
-      db: {
-        url: process.env.DATABASE_URL,
-      },
-    },
-  })
-}
-
-// Connection pooling setup
-export const prisma = globalThis.__prisma || createPrismaClient()
-
-if (process.env.NODE_ENV !== 'production') {
-  globalThis.__prisma = prisma
-}
+// Share the client (and its connection pool) from db.ts. A second
+// PrismaClient here would open its own pool alongside it and double the
+// connections each instance holds against the database.
+export { prisma }
 
 // Connection management for serverless/edge functions
 export const connectToDatabase = async () => {
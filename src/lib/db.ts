@@ -2,8 +2,44 @@ import { PrismaClient } from '@prisma/client'
 
 const globalForPrisma = globalThis as unknown as {
   prisma: PrismaClient | undefined
+  prismaRead: PrismaClient | undefined
 }
 
-export const prisma = globalForPrisma.prisma ?? new PrismaClient()
+// Pool tuning is passed through connection-string parameters. Each one is
+// only applied when DATABASE_URL doesn't already set it, so a fully tuned
+// URL always wins.
+const poolParams: Record<string, string | undefined> = {
+  connection_limit: process.env.DATABASE_CONNECTION_LIMIT,
+  pool_timeout: process.env.DATABASE_POOL_TIMEOUT,
+  statement_cache_size: process.env.DATABASE_STATEMENT_CACHE_SIZE,
+}
+
+function buildDatasourceUrl(url = process.env.DATABASE_URL) {
+  if (!url) return undefined
+
+  const parsed = new URL(url)
+  for (const [key, value] of Object.entries(poolParams)) {
+    if (value && !parsed.searchParams.has(key)) {
+      parsed.searchParams.set(key, value)
+    }
+  }
+  return parsed.toString()
+}
+
+export const prisma = globalForPrisma.prisma ?? new PrismaClient({
+  datasourceUrl: buildDatasourceUrl(),
+})
+
+// Read-only catalog traffic (product lists, product pages, categories) can
+// be served from a replica. Without DATABASE_REPLICA_URL this is simply the
+// primary client, so callers never need to check.
+export const prismaRead = globalForPrisma.prismaRead ?? (
+  process.env.DATABASE_REPLICA_URL
+    ? new PrismaClient({ datasourceUrl: buildDatasourceUrl(process.env.DATABASE_REPLICA_URL) })
+    : prisma
+)
 
-if (process.env.NODE_ENV !== 'production') globalForPrisma.prisma = prisma 
\ No newline at end of file
+if (process.env.NODE_ENV !== 'production') {
+  globalForPrisma.prisma = prisma
+  globalForPrisma.prismaRead = prismaRead
+} 
\ No newline at end of file
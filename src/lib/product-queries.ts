@@ -0,0 +1,30 @@
+import { Prisma } from '@prisma/client'
+
+// Shared relation-loading shapes. Product cards, cart lines and order lines
+// all show the same first image, so the include lives here once instead of
+// being re-declared inline in every route.
+
+// Storefront reads only ever see live products. The catalog listing indexes
+// lead with isActive, so the list's sorted scans stay on them.
+export const activeProduct = {
+  isActive: true,
+} satisfies Prisma.ProductWhereInput
+
+export const primaryImage = {
+  orderBy: { position: 'asc' },
+  take: 1,
+} satisfies Prisma.ProductInclude['images']
+
+export const productWithPrimaryImage = {
+  include: {
+    images: primaryImage,
+  },
+} satisfies Prisma.ProductDefaultArgs
+
+// Cart and order items share the same line shape: the product plus its
+// primary image
+export const lineItemsWithProduct = {
+  include: {
+    product: productWithPrimaryImage,
+  },
+} satisfies Prisma.OrderInclude['items']
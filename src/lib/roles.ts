@@ -0,0 +1,12 @@
+// Role groups shared by the middleware and the API guards, so an area's
+// allowed roles are declared once. Plain strings rather than the Prisma Role
+// enum, since the middleware runs on the edge runtime.
+
+// Everyone who works in the admin area and on service requests
+export const staffRoles: ReadonlySet<string> = new Set(['ADMIN', 'MANAGER', 'TECHNICIAN'])
+
+// Staff who can manage any service request and see service analytics
+export const managerRoles: ReadonlySet<string> = new Set(['ADMIN', 'MANAGER'])
+
+// Roles allowed into the technician area and its dashboard
+export const technicianAreaRoles: ReadonlySet<string> = new Set(['TECHNICIAN', 'MANAGER'])
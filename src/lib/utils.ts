@@ -4,3 +4,12 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
+
+const nonSlugChars = /[^a-z0-9]+/g
+const edgeDashes = /^-+|-+$/g
+
+// URL slug for product and category names: lowercase, runs of anything
+// else collapsed to a single dash, no leading or trailing dashes
+export function slugify(name: string) {
+  return name.toLowerCase().replace(nonSlugChars, "-").replace(edgeDashes, "")
+}
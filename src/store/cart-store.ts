@@ -39,10 +39,16 @@ export const useCartStore = create<CartStore>()(
       totalPrice: 0,
       
       _updateTotals: () => {
-        const items = get().items
-        const totalItems = items.reduce((total, item) => total + item.quantity, 0)
-        const totalPrice = items.reduce((total, item) => total + (Number(item.price) * item.quantity), 0)
-        set({ totalItems, totalPrice })
+        // Sum quantity and price in a single pass over the items. Money is
+        // added up in integer cents so the total doesn't pick up float drift
+        // (0.1 + 0.2) as lines are added
+        let totalItems = 0
+        let totalCents = 0
+        for (const item of get().items) {
+          totalItems += item.quantity
+          totalCents += Math.round(Number(item.price) * 100) * item.quantity
+        }
+        set({ totalItems, totalPrice: totalCents / 100 })
       },
       
       addItem: (product) => {